@@ -41,9 +41,54 @@ GUIDELINES:
 - You can answer general knowledge questions too, but steer back to Hashtag Tech when relevant.
 - Never make up information about the company that isn't listed above.`;
 
+// Upper bound on the request body; the chat widget trims history well below this
+const MAX_BODY_BYTES = 128 * 1024;
+
+/**
+ * Read and parse a JSON request body, cancelling the read as soon as it
+ * exceeds `limit` bytes. Works with or without a Content-Length header.
+ *
+ * @returns Parsed body, or null if the body is larger than `limit`
+ */
+async function readJsonBody<T>(req: Request, limit: number): Promise<T | null> {
+  if (Number(req.headers.get('content-length')) > limit) return null;
+  if (!req.body) throw new Error('Request body is empty');
+
+  const reader = req.body.getReader();
+  const chunks: Uint8Array[] = [];
+  let received = 0;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    received += value.byteLength;
+    if (received > limit) {
+      await reader.cancel();
+      return null;
+    }
+    chunks.push(value);
+  }
+
+  const bytes = new Uint8Array(received);
+  let offset = 0;
+  for (const chunk of chunks) {
+    bytes.set(chunk, offset);
+    offset += chunk.byteLength;
+  }
+
+  return JSON.parse(new TextDecoder().decode(bytes)) as T;
+}
+
 export async function POST(req: Request) {
   try {
-    const { messages }: { messages: UIMessage[] } = await req.json();
+    const body = await readJsonBody<{ messages: UIMessage[] }>(req, MAX_BODY_BYTES);
+    if (!body) {
+      return new Response(
+        JSON.stringify({ error: 'Request body too large' }),
+        { status: 413, headers: { 'Content-Type': 'application/json' } }
+      );
+    }
+    const { messages } = body;
 
     const result = streamText({
       model: openai('gpt-4o-mini'),
@@ -7,7 +7,7 @@ import { BsRobot } from "react-icons/bs";
 import ReactMarkdown from "react-markdown";
 import Link from "next/link";
 import { useChat } from "@ai-sdk/react";
-import type { UIMessage } from "ai";
+import { DefaultChatTransport, type UIMessage } from "ai";
 
 /**
  * AI-Powered Chat Widget
@@ -19,6 +19,7 @@ import type { UIMessage } from "ai";
  * - Typing indicator with bouncing dots
  * - Markdown rendering with custom link styling
  * - Error handling with retry
+ * - Bounded request size (recent history only, capped input length)
  * - Auto-scroll & cleanup on unmount
  * - Premium animated floating button
  */
@@ -36,6 +37,24 @@ const INITIAL_MESSAGES: UIMessage[] = [
   },
 ];
 
+// Only the most recent turns are sent, keeping every request far below the
+// /api/chat body limit no matter how long the conversation runs
+const MAX_HISTORY_MESSAGES = 20;
+const MAX_INPUT_LENGTH = 2000;
+
+const chatTransport = new DefaultChatTransport<UIMessage>({
+  api: "/api/chat",
+  prepareSendMessagesRequest: ({ id, messages, body, trigger, messageId }) => ({
+    body: {
+      ...body,
+      id,
+      messages: messages.slice(-MAX_HISTORY_MESSAGES),
+      trigger,
+      messageId,
+    },
+  }),
+});
+
 export function ChatWidget() {
   const [isOpen, setIsOpen] = useState(false);
   const [input, setInput] = useState("");
@@ -55,6 +74,7 @@ export function ChatWidget() {
     setMessages,
   } = useChat({
     messages: INITIAL_MESSAGES,
+    transport: chatTransport,
     experimental_throttle: 50,
   });
 
@@ -482,6 +502,7 @@ export function ChatWidget() {
                     type="text"
                     value={input}
                     onChange={(e) => setInput(e.target.value)}
+                    maxLength={MAX_INPUT_LENGTH}
                     placeholder="Ask about our services..."
                     disabled={status !== "ready" && status !== "error"}
                     className="flex-1 bg-gray-50 focus:bg-white border border-gray-200 focus:border-primary/50 rounded-full px-5 py-3 text-sm font-medium text-gray-900 placeholder:text-gray-400 focus:outline-none focus:ring-2 focus:ring-primary/20 disabled:opacity-50 disabled:cursor-not-allowed transition-all"